@@ -1,5 +1,20 @@
 """MCP Plugin Marketplace package."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 __all__ = ["Marketplace", "PluginMetadata"]
 
-from .marketplace import Marketplace, PluginMetadata  # noqa: F401
\ No newline at end of file
+if TYPE_CHECKING:
+    from .marketplace import Marketplace, PluginMetadata  # noqa: F401
+
+
+def __getattr__(name: str) -> Any:
+    # Import the marketplace lazily so that ``python -m
+    # mcp_plugin_marketplace.cli --help`` does not pay for it.
+    if name in __all__:
+        from . import marketplace
+
+        return getattr(marketplace, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,96 @@
+"""On-disk cache of parsed marketplace state for the CLI.
+
+Each CLI invocation is a fresh process, so without a cache the catalogue
+JSON and every installed manifest are re-parsed on every command.  The
+cache stores those results in a pickle under ``~/.mcp`` and validates
+each entry against the modification time of the file or directory it
+was built from.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_PATH = Path.home() / ".mcp" / "cli_cache.pkl"
+
+# Setting this environment variable disables the cache entirely, which is
+# useful while developing plugins or the marketplace itself.
+DEV_ENV_VAR = "MCP_CLI_DEV"
+
+# Bump whenever the shape of a cached object (e.g. PluginMetadata) changes,
+# so pickles written by older versions are discarded rather than loaded
+# into incompatible classes.
+CACHE_VERSION = 1
+
+# pickle reads and writes the file in many small chunks, so use a buffer
+# large enough to hold a typical cache and touch the disk once.
+_BUFFER_SIZE = 1 << 16
+
+
+def cache_disabled() -> bool:
+    """Return True if the cache is disabled via ``MCP_CLI_DEV``."""
+    return bool(os.environ.get(DEV_ENV_VAR))
+
+
+class CliCache:
+    """Pickle-backed cache of values keyed by name and source mtime."""
+
+    def __init__(self, path: Optional[str | Path] = None, refresh: bool = False) -> None:
+        """Open the cache.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            Location of the pickle file.  Defaults to ``~/.mcp/cli_cache.pkl``.
+        refresh : bool
+            If True, ignore any existing cache contents so every entry is
+            rebuilt and written back.
+        """
+        self.path = Path(path) if path is not None else CACHE_PATH
+        self._entries: Dict[str, Tuple[str, int, Any]] = {}
+        if not refresh:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb", buffering=_BUFFER_SIZE) as fh:
+                version, entries = pickle.load(fh)
+        except Exception:
+            # Missing, truncated or incompatible caches are simply rebuilt.
+            return
+        if version == CACHE_VERSION and isinstance(entries, dict):
+            self._entries = entries
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            with open(tmp, "wb", buffering=_BUFFER_SIZE) as fh:
+                pickle.dump((CACHE_VERSION, self._entries), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            # The cache is an optimisation only; never fail a command on it.
+            pass
+
+    def get(self, key: str, source: Path, mtime_ns: int) -> Optional[Any]:
+        """Return the cached value for ``key`` if it was built from ``source``
+        at modification time ``mtime_ns``, otherwise None.
+
+        Callers that validate the value's contents themselves pass 0 for
+        ``mtime_ns`` in both ``get`` and ``put``.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_source, cached_mtime, value = entry
+        if cached_source != str(source) or cached_mtime != mtime_ns:
+            return None
+        return value
+
+    def put(self, key: str, source: Path, mtime_ns: int, value: Any) -> None:
+        """Store ``value`` for ``key`` and persist the cache to disk."""
+        self._entries[key] = (str(source), mtime_ns, value)
+        self._save()
@@ -2,20 +2,61 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import Optional
+import importlib
+import os
+from typing import Dict, List, Optional
 
 import click
 
-from .marketplace import Marketplace
 
-
-@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when needed.
+
+    Subcommands are registered as ``{name: "module.path:attribute"}``
+    so that running one command does not pay the import cost of the
+    others.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        module = importlib.import_module(module_name, package=__package__)
+        command = getattr(module, attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand '{cmd_name}' did not resolve to a click command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "list": ".commands.list:list",
+        "installed": ".commands.installed:installed",
+        "install": ".commands.install:install",
+        "uninstall": ".commands.uninstall:uninstall",
+        "test": ".commands.test:test",
+        "search": ".commands.search:search",
+    },
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
 @click.option(
     "--catalogue",
     "catalogue_path",
-    type=click.Path(exists=True, dir_okay=False, readable=True, path_type=str),
+    # A plain string rather than click.Path: validating would stat the
+    # path during parsing; unreadable catalogues are reported on load.
+    type=str,
+    metavar="FILE",
     default=None,
     help="Path to a JSON file describing available plugins.  If omitted, the default bundled catalogue is used.",
 )
@@ -26,88 +67,35 @@ from .marketplace import Marketplace
     default=None,
     help="Directory where plugins are installed.  Defaults to ~/.mcp/plugins_installed.",
 )
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    default=False,
+    help="Rebuild the cached catalogue and installed plugin listing.  Set MCP_CLI_DEV to disable the cache entirely.",
+)
 @click.pass_context
-def cli(ctx: click.Context, catalogue_path: Optional[str], install_dir: Optional[str]) -> None:
+def cli(
+    ctx: click.Context,
+    catalogue_path: Optional[str],
+    install_dir: Optional[str],
+    refresh_cache: bool,
+) -> None:
     """Manage MCP plugins."""
-    ctx.obj = Marketplace(catalogue_path=catalogue_path, install_dir=install_dir)
-
-
-@cli.command()
-@click.pass_obj
-def list(obj: Marketplace) -> None:
-    """List available plugins in the catalogue."""
-    available = obj.list_available()
-    if not available:
-        click.echo("No available plugins found in the catalogue.")
-        return
-    click.echo("Available plugins:")
-    for plugin in available:
-        click.echo(f"- {plugin.get('name')} {plugin.get('version')}: {plugin.get('description')}")
-
-
-@cli.command()
-@click.pass_obj
-def installed(obj: Marketplace) -> None:
-    """List currently installed plugins."""
-    installed = obj.list_installed()
-    if not installed:
-        click.echo("No plugins installed.")
-        return
-    click.echo("Installed plugins:")
-    for plugin in installed:
-        click.echo(f"- {plugin.name} {plugin.version}: {plugin.description}")
-
-
-@cli.command()
-@click.argument("source", type=click.Path(exists=True, dir_okay=True, path_type=str))
-@click.pass_obj
-def install(obj: Marketplace, source: str) -> None:
-    """Install a plugin from a local directory or zip file."""
-    plugin = obj.install(source)
-    click.echo(f"Installed {plugin.name} version {plugin.version}")
-
-
-@cli.command()
-@click.argument("plugin_name", type=str)
-@click.pass_obj
-def uninstall(obj: Marketplace, plugin_name: str) -> None:
-    """Uninstall a plugin by name."""
-    success = obj.uninstall(plugin_name)
-    if success:
-        click.echo(f"Uninstalled {plugin_name}")
-    else:
-        click.echo(f"Plugin '{plugin_name}' not found")
-
-
-@cli.command()
-@click.argument("plugin_name", type=str)
-@click.pass_obj
-def test(obj: Marketplace, plugin_name: str) -> None:
-    """Test an installed plugin by running its run_test function."""
+    from ._cache import CliCache, cache_disabled
+    from .marketplace import Marketplace
+
+    # Only the bundled default may be absent (an empty catalogue); a path
+    # the user named that does not exist is almost certainly a typo.
+    if catalogue_path is not None and not os.path.exists(catalogue_path):
+        raise click.BadParameter(f"File {catalogue_path!r} does not exist.", param_hint="'--catalogue'")
+    cache = None if cache_disabled() else CliCache(refresh=refresh_cache)
     try:
-        success = obj.test(plugin_name)
-        if success:
-            click.echo(f"Plugin '{plugin_name}' test passed")
-        else:
-            click.echo(f"Plugin '{plugin_name}' test returned False")
-    except Exception as e:
-        click.echo(f"Error testing plugin '{plugin_name}': {e}")
-
-
-@cli.command()
-@click.argument("keyword", type=str)
-@click.pass_obj
-def search(obj: Marketplace, keyword: str) -> None:
-    """Search available plugins by keyword."""
-    keyword_lower = keyword.lower()
-    matches = [p for p in obj.list_available() if keyword_lower in p.get("name", "").lower() or keyword_lower in p.get("description", "").lower()]
-    if not matches:
-        click.echo(f"No available plugins matching '{keyword}'.")
-        return
-    click.echo(f"Plugins matching '{keyword}':")
-    for plugin in matches:
-        click.echo(f"- {plugin.get('name')} {plugin.get('version')}: {plugin.get('description')}")
+        ctx.obj = Marketplace(catalogue_path=catalogue_path, install_dir=install_dir, cache=cache)
+    except OSError as e:
+        raise click.BadParameter(
+            f"cannot read catalogue: {e.strerror or e}", param_hint="'--catalogue'"
+        ) from e
 
 
 if __name__ == "__main__":  # pragma: no cover
-    cli()
\ No newline at end of file
+    cli()
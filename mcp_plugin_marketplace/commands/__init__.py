@@ -0,0 +1,5 @@
+"""Subcommands of the MCP Plugin Marketplace CLI.
+
+Each command lives in its own module so that ``cli.LazyGroup`` only
+imports the code for the command actually being run.
+"""
@@ -0,0 +1,19 @@
+"""``install`` command: install a plugin from a directory or zip file."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+@click.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=True, path_type=str))
+@click.pass_obj
+def install(obj: Marketplace, source: str) -> None:
+    """Install a plugin from a local directory or zip file."""
+    plugin = obj.install(source)
+    click.echo(f"Installed {plugin.name} version {plugin.version}")
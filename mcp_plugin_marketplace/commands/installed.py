@@ -0,0 +1,23 @@
+"""``installed`` command: show plugins currently installed."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+@click.command()
+@click.pass_obj
+def installed(obj: Marketplace) -> None:
+    """List currently installed plugins."""
+    installed = obj.list_installed()
+    if not installed:
+        click.echo("No plugins installed.")
+        return
+    lines = ["Installed plugins:"]
+    lines.extend(f"- {p.name} {p.version}: {p.description}" for p in installed)
+    click.echo("\n".join(lines))
@@ -0,0 +1,23 @@
+"""``list`` command: show plugins available in the catalogue."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+@click.command()
+@click.pass_obj
+def list(obj: Marketplace) -> None:
+    """List available plugins in the catalogue."""
+    available = obj.list_available()
+    if not available:
+        click.echo("No available plugins found in the catalogue.")
+        return
+    lines = ["Available plugins:"]
+    lines.extend(f"- {p.get('name')} {p.get('version')}: {p.get('description')}" for p in available)
+    click.echo("\n".join(lines))
@@ -0,0 +1,38 @@
+"""``search`` command: find catalogue plugins matching a keyword."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+def _complete_keyword(ctx: click.Context, param: click.Parameter, incomplete: str) -> List[str]:
+    """Complete plugin names from the catalogue's prefix index."""
+    from ..marketplace import Marketplace
+
+    catalogue_path = ctx.find_root().params.get("catalogue_path")
+    try:
+        marketplace = Marketplace(catalogue_path=catalogue_path)
+    except OSError:
+        return []
+    incomplete_lower = incomplete.lower()
+    names = {str(p.get("name") or "") for p in marketplace.search_prefix(incomplete)}
+    return sorted(n for n in names if n.lower().startswith(incomplete_lower))
+
+
+@click.command()
+@click.argument("keyword", type=str, shell_complete=_complete_keyword)
+@click.pass_obj
+def search(obj: Marketplace, keyword: str) -> None:
+    """Search available plugins by keyword."""
+    matches = obj.search(keyword)
+    if not matches:
+        click.echo(f"No available plugins matching '{keyword}'.")
+        return
+    lines = [f"Plugins matching '{keyword}':"]
+    lines.extend(f"- {p.get('name')} {p.get('version')}: {p.get('description')}" for p in matches)
+    click.echo("\n".join(lines))
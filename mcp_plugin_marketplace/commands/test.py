@@ -0,0 +1,25 @@
+"""``test`` command: run an installed plugin's ``run_test`` function."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+@click.command()
+@click.argument("plugin_name", type=str)
+@click.pass_obj
+def test(obj: Marketplace, plugin_name: str) -> None:
+    """Test an installed plugin by running its run_test function."""
+    try:
+        success = obj.test(plugin_name)
+        if success:
+            click.echo(f"Plugin '{plugin_name}' test passed")
+        else:
+            click.echo(f"Plugin '{plugin_name}' test returned False")
+    except Exception as e:
+        click.echo(f"Error testing plugin '{plugin_name}': {e}")
@@ -0,0 +1,22 @@
+"""``uninstall`` command: remove an installed plugin."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from ..marketplace import Marketplace
+
+
+@click.command()
+@click.argument("plugin_name", type=str)
+@click.pass_obj
+def uninstall(obj: Marketplace, plugin_name: str) -> None:
+    """Uninstall a plugin by name."""
+    success = obj.uninstall(plugin_name)
+    if success:
+        click.echo(f"Uninstalled {plugin_name}")
+    else:
+        click.echo(f"Plugin '{plugin_name}' not found")
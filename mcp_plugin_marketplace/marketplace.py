@@ -2,17 +2,111 @@
 
 from __future__ import annotations
 
-import importlib.util
 import json
 import os
-import shutil
-import sys
+from bisect import bisect_right
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from ._cache import CliCache
 
-@dataclass
+try:  # optional, substantially faster JSON parser
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _HAS_ORJSON = False
+
+# Catalogues at least this large are memory-mapped rather than read into a
+# bytes object.  Below it the mmap setup costs more than the copy saves.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=8)
+def _parse_catalogue(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, str], ...]:
+    """Parse the catalogue at ``path_str``, memory-mapping it when large.
+
+    Results are memoised on the file's path, mtime and size so every
+    ``Marketplace`` in a process shares one parse.  The memoised value is a
+    tuple so it cannot be altered in place; callers copy the entries
+    before handing them out.  Only orjson can parse directly from a
+    buffer; the stdlib parser needs ``bytes``, so the file is read normally
+    when orjson is unavailable.
+    """
+    try:
+        if not _HAS_ORJSON or size < _MMAP_THRESHOLD:
+            data = _loads(Path(path_str).read_bytes())
+        else:
+            import mmap
+
+            with open(path_str, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = _loads(view)
+    except ValueError:
+        # Covers json/orjson decode errors and invalid UTF-8
+        return ()
+    if not isinstance(data, list):
+        return ()
+    # Callers copy each entry with dict(), so drop anything else here
+    return tuple(p for p in data if isinstance(p, dict))
+
+
+# Below this many manifests to parse, thread start-up costs more than
+# overlapping the file reads saves.
+_PARALLEL_MANIFEST_THRESHOLD = 16
+
+
+def _parse_manifest(manifest: str) -> Optional[PluginMetadata]:
+    """Parse an installed plugin's ``manifest.json``; None if unreadable."""
+    plugin_dir = os.path.dirname(manifest)
+    try:
+        with open(manifest, "rb") as fh:
+            meta = _loads(fh.read())
+        return PluginMetadata(
+            name=meta.get("name", os.path.basename(plugin_dir)),
+            version=meta.get("version", "0.0.0"),
+            description=meta.get("description", ""),
+            path=Path(plugin_dir),
+        )
+    except Exception:
+        return None
+
+
+@contextmanager
+def _sys_path_prepended(path: str) -> Iterator[None]:
+    """Temporarily put ``path`` at the front of ``sys.path``.
+
+    The entry is removed in place so other holders of the ``sys.path``
+    list keep seeing the live object.
+    """
+    import sys
+
+    sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        try:
+            sys.path.remove(path)
+        except ValueError:
+            pass  # the plugin removed it itself
+
+
+# Key under which trie nodes store the indices of matching plugins.  Real
+# edges are single characters, so the empty string cannot collide.
+_PAYLOAD = ""
+
+
+@dataclass(slots=True, frozen=True)
 class PluginMetadata:
     """Metadata describing a plugin."""
 
@@ -22,6 +116,14 @@ class PluginMetadata:
     path: Path  # installed path
 
 
+# Installer methods for archive formats, keyed by lowercased file suffix.
+# Names rather than functions, so subclasses can override an installer.
+# Directories are handled separately since they have no suffix to match.
+_INSTALLERS: Dict[str, str] = {
+    ".zip": "_install_zip",
+}
+
+
 class Marketplace:
     """Simple plugin marketplace manager."""
 
@@ -29,6 +131,7 @@ class Marketplace:
         self,
         catalogue_path: Optional[str] = None,
         install_dir: Optional[str | Path] = None,
+        cache: Optional[CliCache] = None,
     ) -> None:
         """Initialise the marketplace.
 
@@ -40,59 +143,229 @@ class Marketplace:
         install_dir : str or Path, optional
             Directory where plugins will be installed.  Defaults to
             ``~/.mcp/plugins_installed``.
+        cache : CliCache, optional
+            On-disk cache used to skip re-parsing the catalogue and
+            installed manifests when they have not changed.  No caching
+            is performed if omitted.
         """
         if install_dir is None:
             home = Path.home()
             install_dir = home / ".mcp" / "plugins_installed"
         self.install_dir: Path = Path(install_dir)
-        self.install_dir.mkdir(parents=True, exist_ok=True)
+        # Created on first install rather than here, so read-only commands
+        # do not touch the filesystem.
+        self._install_dir_ready = False
         # Determine catalogue file
         if catalogue_path is None:
             # Use file relative to this module
             self.catalogue_path = Path(__file__).resolve().parent / "available_plugins.json"
         else:
             self.catalogue_path = Path(catalogue_path)
+        self.cache = cache
         self.catalogue: List[Dict[str, str]] = []
+        self._index: Optional[Dict[str, Any]] = None
+        # (lowercased name, lowercased description, plugin) per catalogue entry
+        self._search_index: List[Tuple[str, str, Dict[str, str]]] = []
+        # _search_index joined into one string, plus each row's start offset
+        self._corpus: Optional[Tuple[str, List[int]]] = None
+        # manifest path -> (manifest mtime_ns, parsed metadata).  Seeded from
+        # the on-disk cache; every entry is re-validated against its
+        # manifest's mtime in list_installed, so the stored value itself is
+        # not keyed on any mtime.
+        self._manifest_cache: Dict[str, Tuple[int, PluginMetadata]] = {}
+        if cache is not None:
+            self._manifest_cache.update(cache.get("installed", self.install_dir, 0) or {})
         self._load_catalogue()
 
     def _load_catalogue(self) -> None:
         """Load available plugins from the JSON catalogue."""
-        if not self.catalogue_path.exists():
-            self.catalogue = []
-            return
-        with open(self.catalogue_path, "r", encoding="utf-8") as fh:
-            try:
-                self.catalogue = json.load(fh)
-            except json.JSONDecodeError:
-                self.catalogue = []
+        self.catalogue = self._read_catalogue()
+        # Catalogues are user-supplied, so skip entries that are not objects
+        # and coerce non-string fields rather than fail every command.
+        self._search_index = [
+            (str(p.get("name") or "").lower(), str(p.get("description") or "").lower(), p)
+            for p in self.catalogue
+            if isinstance(p, dict)
+        ]
+        self._corpus = None
+        self._index = None
+
+    def _read_catalogue(self) -> List[Dict[str, str]]:
+        """Return the parsed catalogue, from the cache when it is current.
+
+        A missing file gives an empty catalogue; other read errors, such as
+        the path being a directory, propagate as ``OSError``.
+        """
+        try:
+            st = self.catalogue_path.stat()
+        except OSError:
+            return []
+        mtime_ns = st.st_mtime_ns
+        parsed = None
+        if self.cache is not None:
+            parsed = self.cache.get("catalogue", self.catalogue_path, mtime_ns)
+        if parsed is None:
+            parsed = _parse_catalogue(str(self.catalogue_path), mtime_ns, st.st_size)
+            if self.cache is not None:
+                self.cache.put("catalogue", self.catalogue_path, mtime_ns, parsed)
+        # Copy each entry so mutating this instance's catalogue cannot
+        # affect the memoised parse or the cache entry, which is pickled
+        # again whenever any other entry is written.
+        return [dict(p) for p in parsed]
+
+    @staticmethod
+    def _write_json(path: Path, obj: Any) -> None:
+        """Write ``obj`` to ``path`` as compact JSON in a single write."""
+        path.write_bytes(_dumps(obj))
 
     def list_available(self) -> List[Dict[str, str]]:
         """Return the list of available plugins from the catalogue."""
         return self.catalogue
 
+    def search(self, keyword: str) -> List[Dict[str, str]]:
+        """Return catalogue plugins whose name or description contains
+        ``keyword`` (case-insensitive), in catalogue order."""
+        keyword_lower = keyword.lower()
+        return [
+            p
+            for name, description, p in self._search_index
+            if keyword_lower in name or keyword_lower in description
+        ]
+
+    def _build_index(self) -> Dict[str, Any]:
+        """Build a prefix trie over catalogue names and description words.
+
+        The lowercased name and each lowercased description word are
+        inserted, and every node records the indices of the plugins whose
+        tokens pass through it, so a prefix lookup costs O(len(prefix)).
+        The trie holds one node per token character, so it grows linearly
+        with the catalogue.
+        """
+        root: Dict[str, Any] = {}
+        for idx, (name, description, _) in enumerate(self._search_index):
+            for token in {name, *description.split()}:
+                node = root
+                for ch in token:
+                    node = node.setdefault(ch, {})
+                    node.setdefault(_PAYLOAD, set()).add(idx)
+        return root
+
+    def _get_index(self) -> Dict[str, Any]:
+        """Return the prefix trie, building it on first use.
+
+        The trie lives in memory only: it is cheap to build, and storing it
+        in the CLI cache would make every command load it.
+        """
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index
+
+    def search_prefix(self, prefix: str) -> List[Dict[str, str]]:
+        """Return catalogue plugins whose name or any description word
+        starts with ``prefix`` (case-insensitive), in catalogue order.
+
+        Used for tab-completion, where one trie answers many lookups.
+        """
+        if not prefix:
+            return [p for _, _, p in self._search_index]
+        node = self._get_index()
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return []
+        ids: Set[int] = node[_PAYLOAD]
+        return [self._search_index[i][2] for i in sorted(ids)]
+
+    def _get_corpus(self) -> Tuple[str, List[int]]:
+        """Return the search rows joined into one string with row offsets.
+
+        Name and description are separated by an ASCII record separator
+        and rows by a unit separator, so a keyword match cannot span two
+        plugins.
+        """
+        if self._corpus is None:
+            parts: List[str] = []
+            offsets: List[int] = []
+            pos = 0
+            for name, description, _ in self._search_index:
+                row = name + "\x1e" + description
+                offsets.append(pos)
+                parts.append(row)
+                pos += len(row) + 1
+            self._corpus = ("\x1f".join(parts), offsets)
+        return self._corpus
+
+    def search_many(self, keywords: Iterable[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Search for several keywords at once.
+
+        Returns a mapping of each keyword to the plugins ``search`` would
+        return for it.  Each keyword is located with ``str.find`` over a
+        single joined corpus, and matches are mapped back to plugins by
+        bisecting the row offsets, so the per-plugin work happens in C.
+        """
+        corpus, offsets = self._get_corpus()
+        results: Dict[str, List[Dict[str, str]]] = {}
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            matches: List[Dict[str, str]] = []
+            pos = corpus.find(keyword_lower) if offsets else -1
+            while pos != -1:
+                row = bisect_right(offsets, pos) - 1
+                matches.append(self._search_index[row][2])
+                if row + 1 == len(offsets):
+                    break
+                # Skip the rest of this plugin's row
+                pos = corpus.find(keyword_lower, offsets[row + 1])
+            results[keyword] = matches
+        return results
+
     def list_installed(self) -> List[PluginMetadata]:
         """Return a list of installed plugins with metadata."""
-        plugins: List[PluginMetadata] = []
-        if not self.install_dir.exists():
-            return plugins
-        for sub in self.install_dir.iterdir():
-            if sub.is_dir():
-                manifest = sub / "manifest.json"
-                if manifest.exists():
-                    try:
-                        with open(manifest, "r", encoding="utf-8") as fh:
-                            meta = json.load(fh)
-                        plugins.append(
-                            PluginMetadata(
-                                name=meta.get("name", sub.name),
-                                version=meta.get("version", "0.0.0"),
-                                description=meta.get("description", ""),
-                                path=sub,
-                            )
-                        )
-                    except Exception:
-                        continue
-        return plugins
+        if not self.install_dir.is_dir():
+            return []
+        # scandir entries carry the file type from the directory listing,
+        # so is_dir() needs no extra stat.  Manifests are only re-parsed
+        # when their mtime differs from the one seen on a previous call
+        # (or, via the CLI cache, a previous run).
+        slots: List[Optional[PluginMetadata]] = []
+        pending: List[Tuple[int, str, int]] = []  # (slot, manifest, mtime_ns)
+        current: Dict[str, Tuple[int, PluginMetadata]] = {}
+        with os.scandir(self.install_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                manifest = os.path.join(entry.path, "manifest.json")
+                try:
+                    manifest_mtime_ns = os.stat(manifest).st_mtime_ns
+                except OSError:
+                    continue
+                cached_meta = self._manifest_cache.get(manifest)
+                if cached_meta is not None and cached_meta[0] == manifest_mtime_ns:
+                    current[manifest] = cached_meta
+                    slots.append(cached_meta[1])
+                else:
+                    pending.append((len(slots), manifest, manifest_mtime_ns))
+                    slots.append(None)
+        # Reading manifests is I/O bound, so many of them are parsed on a
+        # thread pool to overlap the reads.
+        manifests = [manifest for _, manifest, _ in pending]
+        if len(manifests) < _PARALLEL_MANIFEST_THRESHOLD:
+            parsed: Iterable[Optional[PluginMetadata]] = map(_parse_manifest, manifests)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                parsed = list(ex.map(_parse_manifest, manifests))
+        for (slot, manifest, manifest_mtime_ns), plugin in zip(pending, parsed):
+            if plugin is not None:
+                current[manifest] = (manifest_mtime_ns, plugin)
+                slots[slot] = plugin
+        # Drop uninstalled plugins and only rewrite the cache on changes
+        if current != self._manifest_cache:
+            self._manifest_cache = current
+            if self.cache is not None:
+                self.cache.put("installed", self.install_dir, 0, current)
+        return [plugin for plugin in slots if plugin is not None]
 
     def install(self, plugin_source: str) -> PluginMetadata:
         """Install a plugin from a local directory or zip file.
@@ -102,40 +375,25 @@ class Marketplace:
         src = Path(plugin_source)
         if not src.exists():
             raise FileNotFoundError(f"Plugin source not found: {plugin_source}")
-        if src.suffix.lower() == ".zip":
-            # Extract zip to a temporary folder then move
-            import zipfile
-            with zipfile.ZipFile(src, "r") as z:
-                tmpdir = Path(self.install_dir) / (src.stem + "_tmp")
-                tmpdir.mkdir(parents=True, exist_ok=True)
-                z.extractall(tmpdir)
-                # plugin root should contain manifest.json
-                # move the first level if nested
-                candidates = [p for p in tmpdir.iterdir() if p.is_dir()]
-                if len(candidates) == 1:
-                    extracted_root = candidates[0]
-                else:
-                    extracted_root = tmpdir
-                dest = self.install_dir / extracted_root.name
-                if dest.exists():
-                    shutil.rmtree(dest)
-                shutil.move(str(extracted_root), dest)
-                shutil.rmtree(tmpdir, ignore_errors=True)
-                installed_path = dest
+        self._ensure_install_dir()
+        installer = _INSTALLERS.get(src.suffix.lower())
+        if installer is not None:
+            installed_path = getattr(self, installer)(src)
         elif src.is_dir():
-            dest = self.install_dir / src.name
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
-            installed_path = dest
+            installed_path = self._install_from_dir(src)
         else:
             raise ValueError("Plugin source must be a directory or zip file")
         # Read manifest
         manifest_file = installed_path / "manifest.json"
         if not manifest_file.exists():
             raise ValueError("Invalid plugin: missing manifest.json")
-        with open(manifest_file, "r", encoding="utf-8") as fh:
-            meta = json.load(fh)
+        meta = _loads(manifest_file.read_bytes())
+        # Write __pycache__ now so test() loads bytecode instead of
+        # compiling plugin.py on every run.  quiet=2 keeps compile errors
+        # out of the CLI output; test() reports them when the plugin runs.
+        import compileall
+
+        compileall.compile_dir(installed_path, quiet=2, optimize=0)
         return PluginMetadata(
             name=meta.get("name", installed_path.name),
             version=meta.get("version", "0.0.0"),
@@ -143,8 +401,82 @@ class Marketplace:
             path=installed_path,
         )
 
+    def _ensure_install_dir(self) -> None:
+        """Create the install directory if this instance has not yet."""
+        if not self._install_dir_ready:
+            self.install_dir.mkdir(parents=True, exist_ok=True)
+            self._install_dir_ready = True
+
+    def _install_zip(self, src: Path) -> Path:
+        """Extract a zip archive into the install directory."""
+        import shutil
+        import zipfile
+
+        with zipfile.ZipFile(src, "r") as z:
+            # Normalise names so archives built from "./" (bsdtar, Windows
+            # tar) are treated like any other; the bare "./" entry is dropped.
+            infos = []
+            for info in z.infolist():
+                while info.filename.startswith("./"):
+                    info.filename = info.filename[2:]
+                if info.filename:
+                    infos.append(info)
+            names = {info.filename for info in infos}
+            # If the archive has a single top-level directory holding the
+            # manifest, that directory is the plugin root and other
+            # top-level entries (README, LICENSE) are ignored; otherwise
+            # the archive itself is the root.
+            top_dirs = {name.split("/", 1)[0] for name in names if "/" in name}
+            if len(top_dirs) == 1 and next(iter(top_dirs)) + "/manifest.json" in names:
+                root_name = top_dirs.pop()
+                prefix = root_name + "/"
+                infos = [info for info in infos if info.filename.startswith(prefix)]
+            else:
+                root_name = src.stem
+                prefix = ""
+            if root_name in ("", ".", "..") or "/" in root_name or "\\" in root_name:
+                raise ValueError(f"Invalid plugin: unsafe archive root {root_name!r}")
+            if prefix + "manifest.json" not in names:
+                raise ValueError("Invalid plugin: missing manifest.json")
+            dest = self.install_dir / root_name
+            # Never remove anything but a direct child of the install dir;
+            # a real check rather than assert so it survives ``python -O``.
+            if dest.parent != self.install_dir:
+                raise ValueError(f"Invalid plugin: archive root escapes install dir {root_name!r}")
+            if dest.exists():
+                shutil.rmtree(dest)
+            # Extract straight into the destination, stripping the
+            # nested root so no temporary directory has to be moved.
+            for info in infos:
+                info.filename = info.filename[len(prefix):]
+                if info.filename:
+                    z.extract(info, dest)
+        return dest
+
+    def _install_from_dir(self, src: Path) -> Path:
+        """Copy a plugin directory into the install directory."""
+        import shutil
+
+        dest = self.install_dir / src.name
+        if dest.exists():
+            shutil.rmtree(dest)
+        # Hardlink files when source and install dir share a device;
+        # this is O(1) per file and copies no data.
+        if os.stat(src).st_dev == os.stat(self.install_dir).st_dev:
+            try:
+                shutil.copytree(src, dest, copy_function=os.link)
+            except OSError:
+                # e.g. filesystems without hardlink support
+                shutil.rmtree(dest, ignore_errors=True)
+                shutil.copytree(src, dest)
+        else:
+            shutil.copytree(src, dest)
+        return dest
+
     def uninstall(self, plugin_name: str) -> bool:
         """Uninstall a plugin by name.  Returns True if removed."""
+        import shutil
+
         dest = self.install_dir / plugin_name
         if dest.exists() and dest.is_dir():
             shutil.rmtree(dest)
@@ -153,6 +485,9 @@ class Marketplace:
 
     def test(self, plugin_name: str) -> bool:
         """Run the plugin's test function.  Returns True if test passes."""
+        import importlib.util
+        import sys
+
         plugin_dir = self.install_dir / plugin_name
         if not plugin_dir.exists():
             raise ValueError(f"Plugin '{plugin_name}' not installed")
@@ -160,21 +495,27 @@ class Marketplace:
         plugin_module_file = plugin_dir / "plugin.py"
         if not plugin_module_file.exists():
             raise ValueError(f"Plugin '{plugin_name}' has no plugin.py")
-        # Add plugin_dir to sys.path temporarily
-        sys.path.insert(0, str(plugin_dir))
+        module_name = f"{plugin_name}_module"
+        previous = sys.modules.get(module_name)
         try:
-            spec = importlib.util.spec_from_file_location(
-                f"{plugin_name}_module", plugin_module_file
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)  # type: ignore[call-arg]
-            else:
-                raise ImportError("Could not load plugin module")
-            if not hasattr(module, "run_test"):
-                raise AttributeError("Plugin does not define run_test()")
-            result = module.run_test()
-            return bool(result)
+            with _sys_path_prepended(str(plugin_dir)):
+                spec = importlib.util.spec_from_file_location(module_name, plugin_module_file)
+                if spec and spec.loader:
+                    module = importlib.util.module_from_spec(spec)
+                    # Register like a normal import so plugin code that looks
+                    # itself up (dataclasses, pickle) works while it runs.
+                    sys.modules[module_name] = module
+                    spec.loader.exec_module(module)  # type: ignore[call-arg]
+                else:
+                    raise ImportError("Could not load plugin module")
+                if not hasattr(module, "run_test"):
+                    raise AttributeError("Plugin does not define run_test()")
+                result = module.run_test()
+                return bool(result)
         finally:
-            # Remove path entry
-            sys.path = [p for p in sys.path if p != str(plugin_dir)]
\ No newline at end of file
+            # Unregister so the next test() run executes a fresh module,
+            # putting back any unrelated module that had the same name.
+            if previous is None:
+                sys.modules.pop(module_name, None)
+            else:
+                sys.modules[module_name] = previous
@@ -0,0 +1,344 @@
+"""Tests for the core marketplace logic."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from mcp_plugin_marketplace.marketplace import Marketplace
+
+MANIFEST = b'{"name": "demo", "version": "1.0.0", "description": "Demo plugin"}'
+PLUGIN = b"def run_test():\n    return True\n"
+
+
+def _make_zip(path: Path, entries: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as z:
+        for name, data in entries.items():
+            z.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def marketplace(tmp_path: Path) -> Marketplace:
+    install_dir = tmp_path / "mcp" / "plugins_installed"
+    # An already-installed plugin that a bad archive must not remove
+    (install_dir / "existing").mkdir(parents=True)
+    (install_dir / "existing" / "manifest.json").write_bytes(MANIFEST)
+    return Marketplace(catalogue_path=str(tmp_path / "missing.json"), install_dir=install_dir)
+
+
+def test_install_zip_with_dot_slash_prefix(marketplace: Marketplace, tmp_path: Path) -> None:
+    # bsdtar and Windows tar write "./" entries when archiving a directory
+    archive = _make_zip(
+        tmp_path / "demo.zip",
+        {"./": b"", "./manifest.json": MANIFEST, "./plugin.py": PLUGIN},
+    )
+    plugin = marketplace.install(str(archive))
+    assert plugin.path == marketplace.install_dir / "demo"
+    assert sorted(p.name for p in marketplace.install_dir.iterdir()) == ["demo", "existing"]
+    assert (plugin.path / "plugin.py").exists()
+
+
+def test_install_zip_rejects_parent_root(marketplace: Marketplace, tmp_path: Path) -> None:
+    archive = _make_zip(tmp_path / "evil.zip", {"../manifest.json": MANIFEST})
+    with pytest.raises(ValueError):
+        marketplace.install(str(archive))
+    assert (marketplace.install_dir / "existing" / "manifest.json").exists()
+    assert marketplace.install_dir.parent.exists()
+
+
+def test_install_nested_zip(marketplace: Marketplace, tmp_path: Path) -> None:
+    archive = _make_zip(
+        tmp_path / "archive.zip",
+        {"demo/manifest.json": MANIFEST, "demo/plugin.py": PLUGIN},
+    )
+    plugin = marketplace.install(str(archive))
+    assert plugin.path == marketplace.install_dir / "demo"
+    assert marketplace.test("demo") is True
+
+
+def test_install_nested_zip_ignores_stray_top_level_files(marketplace: Marketplace, tmp_path: Path) -> None:
+    archive = _make_zip(
+        tmp_path / "archive.zip",
+        {"README.md": b"readme", "demo/manifest.json": MANIFEST, "demo/plugin.py": PLUGIN},
+    )
+    plugin = marketplace.install(str(archive))
+    assert plugin.path == marketplace.install_dir / "demo"
+    assert sorted(p.name for p in plugin.path.iterdir()) == ["__pycache__", "manifest.json", "plugin.py"]
+    assert sorted(p.name for p in marketplace.install_dir.iterdir()) == ["demo", "existing"]
+
+
+def test_search_matches_name_and_description_substrings(tmp_path: Path) -> None:
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text(
+        '[{"name": "Greeter", "description": "Says hello"},'
+        ' {"name": "other", "description": "Prints a greeting message"}]'
+    )
+    marketplace = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    assert [p["name"] for p in marketplace.search("GREET")] == ["Greeter", "other"]
+    assert [p["name"] for p in marketplace.search("a greeting")] == ["other"]
+    assert marketplace.search("missing") == []
+    assert marketplace.search_many(["greet", "hello"]) == {
+        "greet": marketplace.search("greet"),
+        "hello": marketplace.search("hello"),
+    }
+
+
+def test_search_prefix_matches_name_and_description_word_prefixes(tmp_path: Path) -> None:
+    from click.shell_completion import ShellComplete
+
+    from mcp_plugin_marketplace._cache import CliCache
+    from mcp_plugin_marketplace.cli import cli
+
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text(
+        '[{"name": "Greeter", "description": "Says hello"},'
+        ' {"name": "weather", "description": "Greets you each morning"},'
+        ' {"name": "other", "description": "Nothing relevant"}]'
+    )
+    cache_path = tmp_path / "cache.pkl"
+    marketplace = Marketplace(
+        catalogue_path=str(catalogue), install_dir=tmp_path / "installed", cache=CliCache(cache_path)
+    )
+    assert [p["name"] for p in marketplace.search_prefix("GREE")] == ["Greeter", "weather"]
+    assert [p["name"] for p in marketplace.search_prefix("he")] == ["Greeter"]
+    assert marketplace.search_prefix("reet") == []
+    assert len(marketplace.search_prefix("")) == 3
+    # The trie is kept in memory only
+    assert set(CliCache(cache_path)._entries) == {"catalogue"}
+
+    completions = ShellComplete(cli, {}, "cli", "_CLI_COMPLETE").get_completions(
+        ["--catalogue", str(catalogue), "search"], "gr"
+    )
+    assert [c.value for c in completions] == ["Greeter"]
+
+
+def test_cli_runs_every_subcommand(tmp_path: Path) -> None:
+    from click.testing import CliRunner
+
+    from mcp_plugin_marketplace.cli import cli
+
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text('[{"name": "demo", "version": "1.0.0", "description": "Demo plugin"}]')
+    source = tmp_path / "demo"
+    source.mkdir()
+    (source / "manifest.json").write_bytes(MANIFEST)
+    (source / "plugin.py").write_bytes(PLUGIN)
+    options = ["--catalogue", str(catalogue), "--install-dir", str(tmp_path / "installed")]
+
+    def run(*args: str) -> str:
+        result = CliRunner().invoke(cli, [*options, *args], env={"MCP_CLI_DEV": "1"})
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    help_text = run("--help")
+    for name in ("list", "installed", "install", "uninstall", "test", "search"):
+        assert name in help_text
+        assert "Usage:" in run(name, "--help")
+    assert "demo 1.0.0: Demo plugin" in run("list")
+    assert "demo 1.0.0: Demo plugin" in run("search", "DEMO")
+    assert run("installed") == "No plugins installed.\n"
+    assert run("install", str(source)) == "Installed demo version 1.0.0\n"
+    assert "demo 1.0.0" in run("installed")
+    assert run("test", "demo") == "Plugin 'demo' test passed\n"
+    assert run("uninstall", "demo") == "Uninstalled demo\n"
+    assert run("uninstall", "demo") == "Plugin 'demo' not found\n"
+
+
+def test_malformed_catalogue_entries_do_not_break_commands(tmp_path: Path) -> None:
+    from click.testing import CliRunner
+
+    from mcp_plugin_marketplace.cli import cli
+
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text('[{"name": 5, "description": null}, {"name": "demo", "description": "Demo"}]')
+    result = CliRunner().invoke(
+        cli,
+        ["--catalogue", str(catalogue), "--install-dir", str(tmp_path / "installed"), "installed"],
+        env={"MCP_CLI_DEV": "1"},
+    )
+    assert result.exit_code == 0, result.output
+    marketplace = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    assert [p["name"] for p in marketplace.search("5")] == [5]
+    assert [p["name"] for p in marketplace.search("demo")] == ["demo"]
+
+
+def test_install_dispatches_to_overridden_installer(tmp_path: Path) -> None:
+    calls: list[Path] = []
+
+    class RecordingMarketplace(Marketplace):
+        def _install_zip(self, src: Path) -> Path:
+            calls.append(src)
+            return super()._install_zip(src)
+
+    marketplace = RecordingMarketplace(
+        catalogue_path=str(tmp_path / "missing.json"), install_dir=tmp_path / "installed"
+    )
+    archive = _make_zip(tmp_path / "demo.zip", {"manifest.json": MANIFEST, "plugin.py": PLUGIN})
+    marketplace.install(str(archive))
+    assert calls == [archive]
+
+
+def test_list_installed_sees_manifest_edits_through_cli_cache(tmp_path: Path) -> None:
+    from mcp_plugin_marketplace._cache import CliCache
+
+    install_dir = tmp_path / "installed"
+    manifest = install_dir / "demo" / "manifest.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_bytes(MANIFEST)
+    cache_path = tmp_path / "cache.pkl"
+
+    def versions() -> list[str]:
+        marketplace = Marketplace(
+            catalogue_path=str(tmp_path / "missing.json"),
+            install_dir=install_dir,
+            cache=CliCache(cache_path),
+        )
+        return [p.version for p in marketplace.list_installed()]
+
+    assert versions() == ["1.0.0"]
+    # Editing in place leaves the install directory's own mtime alone
+    dir_mtime_ns = install_dir.stat().st_mtime_ns
+    manifest.write_bytes(MANIFEST.replace(b"1.0.0", b"9.9.9"))
+    os.utime(manifest, ns=(manifest.stat().st_atime_ns, manifest.stat().st_mtime_ns + 10**9))
+    assert install_dir.stat().st_mtime_ns == dir_mtime_ns
+    assert versions() == ["9.9.9"]
+
+
+def test_list_installed_thread_pool_matches_serial_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_plugin_marketplace import marketplace as marketplace_module
+
+    install_dir = tmp_path / "installed"
+    for i in range(20):
+        (install_dir / f"plugin{i}").mkdir(parents=True)
+        manifest = MANIFEST.replace(b'"demo"', f'"plugin{i}"'.encode())
+        (install_dir / f"plugin{i}" / "manifest.json").write_bytes(manifest)
+    (install_dir / "plugin7" / "manifest.json").write_text("{not json")
+
+    def listed() -> list[marketplace_module.PluginMetadata]:
+        marketplace = Marketplace(catalogue_path=str(tmp_path / "missing.json"), install_dir=install_dir)
+        return marketplace.list_installed()
+
+    assert 20 >= marketplace_module._PARALLEL_MANIFEST_THRESHOLD
+    parallel = listed()
+    monkeypatch.setattr(marketplace_module, "_PARALLEL_MANIFEST_THRESHOLD", 10**9)
+    serial = listed()
+    assert parallel == serial
+    assert len(parallel) == 19
+    assert "plugin7" not in {p.name for p in parallel}
+
+
+def test_install_with_syntax_error_prints_nothing(
+    marketplace: Marketplace, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "broken"
+    source.mkdir()
+    (source / "manifest.json").write_bytes(MANIFEST)
+    (source / "plugin.py").write_text("def run_test(:\n")
+    marketplace.install(str(source))
+    assert capsys.readouterr() == ("", "")
+
+
+def test_test_registers_module_only_while_running(marketplace: Marketplace) -> None:
+    plugin_dir = marketplace.install_dir / "demo"
+    plugin_dir.mkdir()
+    (plugin_dir / "manifest.json").write_bytes(MANIFEST)
+    (plugin_dir / "plugin.py").write_text(
+        "import sys\n\ndef run_test():\n    return sys.modules.get(__name__) is not None\n"
+    )
+    assert marketplace.test("demo") is True
+    assert "demo_module" not in sys.modules
+
+
+def test_test_restores_existing_module_with_the_same_name(
+    marketplace: Marketplace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin_dir = marketplace.install_dir / "demo"
+    plugin_dir.mkdir()
+    (plugin_dir / "manifest.json").write_bytes(MANIFEST)
+    (plugin_dir / "plugin.py").write_bytes(PLUGIN)
+    existing = type(sys)("demo_module")
+    monkeypatch.setitem(sys.modules, "demo_module", existing)
+    assert marketplace.test("demo") is True
+    assert sys.modules["demo_module"] is existing
+
+
+def test_catalogue_mutation_does_not_leak_between_instances(tmp_path: Path) -> None:
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text('[{"name": "demo", "description": "Demo plugin"}]')
+    first = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    first.list_available()[0]["name"] = "changed"
+    first.list_available().append({"name": "extra"})
+    second = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    assert second.list_available() == [{"name": "demo", "description": "Demo plugin"}]
+
+
+def test_catalogue_skips_entries_that_are_not_objects(tmp_path: Path) -> None:
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text('["a", 1, {"name": "demo"}]')
+    marketplace = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    assert marketplace.list_available() == [{"name": "demo"}]
+
+
+def test_missing_explicit_catalogue_is_a_usage_error(tmp_path: Path) -> None:
+    from click.testing import CliRunner
+
+    from mcp_plugin_marketplace.cli import cli
+
+    result = CliRunner().invoke(
+        cli,
+        ["--catalogue", str(tmp_path / "typo.json"), "--install-dir", str(tmp_path / "installed"), "list"],
+        env={"MCP_CLI_DEV": "1"},
+    )
+    assert result.exit_code == 2
+    assert "typo.json" in result.output
+
+
+def test_catalogue_mutation_is_not_written_to_cli_cache(tmp_path: Path) -> None:
+    from mcp_plugin_marketplace._cache import CliCache
+
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text('[{"name": "demo", "description": "Demo plugin"}]')
+    cache_path = tmp_path / "cache.pkl"
+    install_dir = tmp_path / "installed"
+    cache = CliCache(cache_path)
+    for _ in range(2):  # a cache miss, then a cache hit
+        marketplace = Marketplace(catalogue_path=str(catalogue), install_dir=install_dir, cache=cache)
+        marketplace.list_available()[0]["name"] = "changed"
+    # Writing any entry pickles the whole cache again
+    cache.put("other", tmp_path, 0, None)
+    fresh = Marketplace(catalogue_path=str(catalogue), install_dir=install_dir, cache=CliCache(cache_path))
+    assert fresh.list_available() == [{"name": "demo", "description": "Demo plugin"}]
+
+
+def test_large_catalogue_is_parsed_from_a_memory_map(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_plugin_marketplace import marketplace as marketplace_module
+
+    # Stand in for orjson, which is optional, with a parser that accepts buffers
+    seen: list[type] = []
+
+    def loads(data: bytes | memoryview) -> object:
+        seen.append(type(data))
+        return json.loads(bytes(data))
+
+    monkeypatch.setattr(marketplace_module, "_HAS_ORJSON", True)
+    monkeypatch.setattr(marketplace_module, "_loads", loads)
+    # Bypass the per-process memo so the patched parser is really used
+    unmemoised = marketplace_module._parse_catalogue.__wrapped__
+    monkeypatch.setattr(marketplace_module, "_parse_catalogue", unmemoised)
+    plugins = [{"name": f"plugin{i}", "description": "x" * 100} for i in range(1000)]
+    catalogue = tmp_path / "catalogue.json"
+    catalogue.write_text(json.dumps(plugins))
+    assert catalogue.stat().st_size >= marketplace_module._MMAP_THRESHOLD
+    marketplace = Marketplace(catalogue_path=str(catalogue), install_dir=tmp_path / "installed")
+    assert marketplace.list_available() == plugins
+    assert seen == [memoryview]